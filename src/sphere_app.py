@@ -3,6 +3,8 @@ Streams live data from a serial port, computes orientation using a quaternion fi
 and visualizes the orientation on a textured 3D sphere. The orientation data (yaw, pitch, roll)
 is also streamed to a Nominal Connect client.
 """
+import queue
+import threading
 from datetime import datetime, timezone
 
 import connect_python
@@ -11,12 +13,52 @@ from vispy import app
 
 from utils.sphere import SphereOrientation, IMAGE_SIZE
 from utils.quaternion import Quaternion
-from utils.measure import Calibration
-from utils.serial_parser import open_serial_port, read_serial, parse_line
+from utils.measure import Calibration, Measurement
+from utils.serial_parser import open_serial_port, read_serial, parse_line, CAL_PREFIX
 
 # Set up logger
 logger = connect_python.get_logger(__name__)
 
+# Number of timer ticks between polls of the client calibration settings
+CAL_POLL_TICKS = 50
+# Number of timer ticks between sphere frame renders (orientation streams every tick)
+RENDER_EVERY_TICKS = 3
+# Seconds the serial reader thread waits before retrying after an error
+SERIAL_ERROR_BACKOFF = 1.0
+
+def newest_results(lines: list[str]) -> tuple[Measurement | None, Calibration | None]:
+    """
+    Return the newest measurement and calibration found in a batch of lines.
+
+    Lines are walked from newest to oldest, so older measurements are never
+    parsed once a newer one has been found.
+    """
+    measurement = None
+    calibration = None
+    for line in reversed(lines):
+        if measurement is not None and CAL_PREFIX not in line:
+            continue
+        parsed = parse_line(line)
+        if isinstance(parsed, Calibration):
+            if calibration is None:
+                calibration = parsed
+        elif isinstance(parsed, Measurement) and measurement is None:
+            measurement = parsed
+        if measurement is not None and calibration is not None:
+            break
+    return measurement, calibration
+
+def put_latest(slot: queue.Queue, item):
+    """Put `item` into a single-slot queue, replacing any unconsumed item."""
+    try:
+        slot.put_nowait(item)
+    except queue.Full:
+        try:
+            slot.get_nowait()
+        except queue.Empty:
+            pass
+        slot.put_nowait(item)
+
 def handle_calibration_data(client: connect_python.Client, cal: Calibration):
     """Update client calibration values based on received calibration data."""
     client.set_value("center_x", cal.center[0])
@@ -26,7 +68,6 @@ def handle_calibration_data(client: connect_python.Client, cal: Calibration):
     client.set_value("scale_y", cal.scale[1])
     client.set_value("scale_z", cal.scale[2])
     client.set_value("radius", cal.radius)
-    client.set_value("calibration_type", "constant")
 
 
 @connect_python.main
@@ -41,43 +82,97 @@ def stream_data(client: connect_python.Client):
     ser = open_serial_port()
     sphere = SphereOrientation(render=False)
     quat = Quaternion()
+    # Start at CAL_POLL_TICKS so the first tick polls the client immediately
+    cal_poll_counter = CAL_POLL_TICKS
+    render_counter = 0
+    # Whether an orientation has arrived that is not yet in a rendered frame
+    frame_pending = False
+
+    # Latest-only slots filled by the serial reader thread; quat_slot holds
+    # (datetime, q) pairs stamped when the measurement was read
+    quat_slot = queue.Queue(maxsize=1)
+    cal_slot = queue.Queue(maxsize=1)
+    stop_event = threading.Event()
+
+    # Bound methods and constants used on every timer tick
+    get_value = client.get_value
+    set_value = client.set_value
+    stream = client.stream
+    stream_rgb = client.stream_rgb
+    radian = Units.RADIAN
+    get_quat = quat_slot.get_nowait
+    get_cal = cal_slot.get_nowait
+    n_pixels = IMAGE_SIZE * IMAGE_SIZE
+
+    def serial_worker():
+        """Read and parse serial data and estimate orientation off the GUI thread."""
+        quat_bg = Quaternion()
+        while not stop_event.is_set():
+            try:
+                # Block until a line arrives (or the port timeout expires),
+                # then drain whatever else is already waiting.
+                lines = read_serial(ser, block=True)
+                if not lines:
+                    continue
+
+                measurement, calibration = newest_results(lines)
+                if calibration is not None:
+                    put_latest(cal_slot, calibration)
+                if measurement is not None:
+                    t_datetime = datetime.now(timezone.utc)
+                    quat_bg.update(measurement)
+                    put_latest(quat_slot, (t_datetime, quat_bg.q.copy()))
+            except Exception:
+                logger.exception("Error in serial reader thread")
+                stop_event.wait(SERIAL_ERROR_BACKOFF)
 
     def on_timer(event):
-        # Handle calibration updates from the client.
-        cal_type = client.get_value("calibration_type") == "constant"
-        if not cal_type:
-            logger.info("Requesting manual calibration from device")
-            ser.write("SCAL\r".encode("utf-8"))
-            client.set_value("calibration_type", "constant")
-
-        # Read serial data.
-        line = read_serial(ser)
-        if not line:
-            return
-
-        # Parse measurement data or calibration data from serial.
-        result = parse_line(line)
-        if not result:
-            return
-        elif isinstance(result, Calibration):
-            logger.info("Received calibration data from device: %s", result)
-            handle_calibration_data(client, result)
-            return
-
-        # Update quaternion and sphere orientation.
-        quat.update(result)
-        sphere.update(quat)
-
-        # Extract Euler angles from quaternion.
-        yaw, pitch, roll = quat.to_euler_zyx()
-        t_datetime = datetime.now(timezone.utc)
-
-        # Stream frame buffer and orientation data.
-        pixels = sphere.to_bytes(n_pixels=IMAGE_SIZE * IMAGE_SIZE)
-        client.stream_rgb("frame_buffer", 0, IMAGE_SIZE, pixels)
-        client.stream("yaw", t_datetime, yaw, name="yaw", unit=Units.RADIAN)
-        client.stream("pitch", t_datetime, pitch, name="pitch", unit=Units.RADIAN)
-        client.stream("roll", t_datetime, roll, name="roll", unit=Units.RADIAN)
+        nonlocal cal_poll_counter, render_counter, frame_pending
+
+        # Handle calibration updates from the client. The setting only changes
+        # on user input, so poll it every CAL_POLL_TICKS ticks instead of every tick.
+        cal_poll_counter += 1
+        if cal_poll_counter >= CAL_POLL_TICKS:
+            cal_poll_counter = 0
+            cal_type = get_value("calibration_type") == "constant"
+            if not cal_type:
+                logger.info("Requesting manual calibration from device")
+                ser.write("SCAL\r".encode("utf-8"))
+                set_value("calibration_type", "constant")
+
+        # Forward calibration data received by the serial thread.
+        try:
+            calibration = get_cal()
+        except queue.Empty:
+            pass
+        else:
+            logger.info("Received calibration data from device: %s", calibration)
+            handle_calibration_data(client, calibration)
+
+        # Take the newest orientation estimated by the serial thread and
+        # stream its Euler angles.
+        render_counter += 1
+        try:
+            t_datetime, quat.q = get_quat()
+        except queue.Empty:
+            pass
+        else:
+            yaw, pitch, roll = quat.to_euler_zyx()
+            stream("yaw", t_datetime, yaw, name="yaw", unit=radian)
+            stream("pitch", t_datetime, pitch, name="pitch", unit=radian)
+            stream("roll", t_datetime, roll, name="roll", unit=radian)
+            frame_pending = True
+
+        # Render and stream the frame buffer at a reduced cadence.
+        if frame_pending and render_counter >= RENDER_EVERY_TICKS:
+            render_counter = 0
+            frame_pending = False
+            sphere.update(quat)
+            pixels = sphere.to_bytes(n_pixels=n_pixels)
+            stream_rgb("frame_buffer", 0, IMAGE_SIZE, pixels)
+
+    reader = threading.Thread(target=serial_worker, name="serial-reader", daemon=True)
+    reader.start()
 
     timer = app.Timer(interval=0.01, connect=on_timer, start=True)
     try:
@@ -85,6 +180,10 @@ def stream_data(client: connect_python.Client):
     except KeyboardInterrupt:
         print("Exiting...")
     finally:
+        stop_event.set()
+        # Each read is bounded by the port timeout, so the worker exits soon
+        # after stop_event is set; wait for it so the port is not closed mid-read.
+        reader.join()
         if ser:
             ser.close()
 
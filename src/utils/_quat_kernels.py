@@ -0,0 +1,45 @@
+"""
+Scalar quaternion conversion kernels.
+
+These are JIT-compiled with Numba when it is installed; otherwise they run
+as plain Python functions.
+"""
+import math
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator used when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def quat_to_euler_zyx(w, x, y, z):
+    """Return (yaw, pitch, roll) in radians for a unit quaternion."""
+    yaw = math.atan2(2.0*(w*z + x*y), 1.0 - 2.0*(y*y + z*z))
+    sinp = 2.0*(w*y - z*x)
+    pitch = math.asin(min(max(sinp, -1.0), 1.0))
+    roll = math.atan2(2.0*(w*x + y*z), 1.0 - 2.0*(x*x + y*y))
+    return yaw, pitch, roll
+
+
+@njit(cache=True, fastmath=True)
+def quat_to_matrix4(w, x, y, z, out):
+    """Write the rotation part of a unit quaternion into a 4x4 array `out`."""
+    xx, yy, zz = x*x, y*y, z*z
+    xy, xz, yz = x*y, x*z, y*z
+    wx, wy, wz = w*x, w*y, w*z
+
+    out[0, 0] = 1 - 2*(yy + zz)
+    out[0, 1] = 2*(xy - wz)
+    out[0, 2] = 2*(xz + wy)
+    out[1, 0] = 2*(xy + wz)
+    out[1, 1] = 1 - 2*(xx + zz)
+    out[1, 2] = 2*(yz - wx)
+    out[2, 0] = 2*(xz - wy)
+    out[2, 1] = 2*(yz + wx)
+    out[2, 2] = 1 - 2*(xx + yy)
+    return out
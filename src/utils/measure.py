@@ -7,6 +7,8 @@ logger = connect_python.get_logger(__name__)
 
 class Measurement:
     """Class to hold measurement data."""
+    __slots__ = ("mag", "acc")
+
     def __init__(self, mag: tuple[float, float, float], acc: tuple[float, float, float]):
         self.mag = mag
         self.acc = acc
@@ -16,6 +18,8 @@ class Measurement:
 
 class Calibration:
     """Class to hold calibration parameters."""
+    __slots__ = ("is_constant", "center", "scale", "radius")
+
     def __init__(self, 
                  is_constant: bool, 
                  center: tuple[int, int, int], 
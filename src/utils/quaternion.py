@@ -1,50 +1,63 @@
 """
 Module for quaternion representation and conversion to rotation matrix.
 """
+import math
+
 import numpy as np
 from ahrs.filters import FQA
 
+from ._quat_kernels import quat_to_euler_zyx, quat_to_matrix4
+
 class Quaternion:
     """Quaternion representation and conversion to rotation matrix."""
     def __init__(self):
         self.q = np.array([1.0, 0.0, 0.0, 0.0])
+        # Orientation filter and normalized sensor buffers reused by `update`
+        self._fqa = FQA()
+        self._acc_buf = np.empty(3)
+        self._mag_buf = np.empty(3)
 
     def __repr__(self) -> str:
         return f"Quaternion(q={self.q})"
 
     def update(self, measurement):
         """Update quaternion from magnetometer and accelerometer data."""
-        acc = np.array(measurement.acc, dtype=float)
-        acc_norm = np.linalg.norm(acc)
+        ax, ay, az = measurement.acc
+        acc_norm = math.sqrt(ax*ax + ay*ay + az*az)
         if acc_norm > 0:
-            acc /= acc_norm
+            acc = self._acc_buf
+            acc[0], acc[1], acc[2] = ax / acc_norm, ay / acc_norm, az / acc_norm
         else:
             print("Warning: Zero accelerometer reading")
             return
 
-        mag = np.array(measurement.mag, dtype=float)
-        mag_norm = np.linalg.norm(mag)
+        mx, my, mz = measurement.mag
+        mag_norm = math.sqrt(mx*mx + my*my + mz*mz)
         if mag_norm > 0:
-            mag /= mag_norm
+            mag = self._mag_buf
+            mag[0], mag[1], mag[2] = mx / mag_norm, my / mag_norm, mz / mag_norm
         else:
             print("Warning: Zero magnetometer reading")
             return
 
         # use FQA (acc+mag) to estimate orientation
-        fqa = FQA()
-        self.q = fqa.estimate(acc=acc, mag=mag)
+        self.q = self._fqa.estimate(acc=acc, mag=mag)
 
-    def to_matrix4(self):
-        """4x4 homogeneous rotation matrix"""
-        w, x, y, z = self.q
+    def to_matrix4(self, out: np.ndarray | None = None):
+        """
+        4x4 homogeneous rotation matrix.
 
-        R = np.array([
-            [1 - 2*(y*y + z*z),     2*(x*y - z*w),     2*(x*z + y*w), 0],
-            [2*(x*y + z*w),     1 - 2*(x*x + z*z),     2*(y*z - x*w), 0],
-            [2*(x*z - y*w),         2*(y*z + x*w), 1 - 2*(x*x + y*y), 0],
-            [0, 0, 0, 1]
-        ])
-        return R
+        Parameters
+        ----------
+        out : np.ndarray, optional
+            Preallocated 4x4 homogeneous matrix to write into. Only the
+            rotation entries are written; the last row and column are
+            left as they are. If omitted, a new float32 matrix is returned.
+        """
+        if out is None:
+            out = np.eye(4, dtype=np.float32)
+        w, x, y, z = self.q.tolist()
+        return quat_to_matrix4(w, x, y, z, out)
 
     def to_euler_zyx(self, degrees: bool = False):
         """
@@ -64,10 +77,8 @@ class Quaternion:
         Uses the aerospace Z-Y-X convention. Angle extraction clamps the
         pitch term to handle numerical drift near +/-90°.
         """
-        w, x, y, z = self.q
-        yaw = np.arctan2(2.0*(w*z + x*y), 1.0 - 2.0*(y*y + z*z))
-        pitch = np.arcsin(np.clip(2.0*(w*y - z*x), -1.0, 1.0))
-        roll = np.arctan2(2.0*(w*x + y*z), 1.0 - 2.0*(x*x + y*y))
+        w, x, y, z = self.q.tolist()
+        yaw, pitch, roll = quat_to_euler_zyx(w, x, y, z)
         if degrees:
-            return tuple(np.degrees([yaw, pitch, roll]))
+            return math.degrees(yaw), math.degrees(pitch), math.degrees(roll)
         return yaw, pitch, roll
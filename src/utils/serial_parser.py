@@ -14,54 +14,112 @@ logger = connect_python.get_logger(__name__)
 # Serial port configuration
 SERIAL_PORT = '/dev/ttyACM0'
 BAUD_RATE = 115200
+# Requested driver buffer sizes (only honoured on platforms that support it)
+RX_BUFFER_SIZE = 65536
+TX_BUFFER_SIZE = 4096
 
 # Regex pattern to match the expected format
 meas_pattern = re.compile(r'Measurement: (-?\d+(?:\.\d+)?), (-?\d+(?:\.\d+)?), (-?\d+(?:\.\d+)?), (-?\d+(?:\.\d+)?), (-?\d+(?:\.\d+)?), (-?\d+(?:\.\d+)?)\r?\n?')
 cal_pattern = re.compile(r'Calibration: (-?\d+), (-?\d+), (-?\d+), (-?\d+), (-?\d+), (-?\d+), (\d+)\r?\n?')
 
+# Line prefixes used by the split-based fast path in `parse_line`
+MEAS_PREFIX = 'Measurement: '
+CAL_PREFIX = 'Calibration: '
+
 def open_serial_port(port: str=SERIAL_PORT, baudrate: int=BAUD_RATE) -> serial.Serial:
     """Open and return a serial port."""
     try:
         uart = serial.Serial(port, baudrate, timeout=1)
+        # Enlarge the driver buffers so bursts are not dropped between drains.
+        # pyserial only implements this on Windows; on POSIX the termios
+        # settings it applies (VMIN=0, VTIME=0) already give non-blocking reads.
+        try:
+            uart.set_buffer_size(rx_size=RX_BUFFER_SIZE, tx_size=TX_BUFFER_SIZE)
+        except AttributeError:
+            pass
         logger.info("Successfully opened %s", port)
         return uart
     except serial.SerialException as e:
         logger.error("Could not open serial port %s: %s", port, e)
         sys.exit(1)
 
-def read_serial(uart: serial.Serial | None) -> str | None:
-    """Read a line from the serial port."""
+def read_serial(uart: serial.Serial | None, block: bool = False) -> list[str]:
+    """
+    Drain the serial receive buffer and return the complete lines in it.
+
+    Everything currently waiting is read in one call. If that leaves a
+    partial line at the end, the rest of it is read with ``readline`` so
+    the next call starts on a line boundary.
+
+    If `block` is True and nothing is waiting, wait (up to the port timeout)
+    for a first line before draining. Errors are then raised to the caller
+    instead of being logged, so a reader loop can back off on a failed port.
+    """
     try:
-        if uart and uart.in_waiting > 0:
-            line_bytes = uart.readline()
-            line_str = line_bytes.decode('utf-8', errors='ignore').strip()
-            return line_str
-        return None
+        if not uart:
+            return []
+        data = b''
+        if block and uart.in_waiting == 0:
+            data = uart.readline()
+        waiting = uart.in_waiting
+        if waiting > 0:
+            data += uart.read(waiting)
+        if not data:
+            return []
+        if not data.endswith(b'\n'):
+            data += uart.readline()
+        text = data.decode('utf-8', errors='ignore')
+        return [line.strip() for line in text.splitlines() if line.strip()]
     except Exception as e:
+        if block:
+            raise
         logger.error("Error reading from serial port: %s", e)
-        return None
+        return []
+
+def _is_field(field: str, signed: bool = True, fraction: bool = False) -> bool:
+    r"""Return True if `field` has the form ``-?\d+`` (or ``-?\d+(\.\d+)?`` with `fraction`)."""
+    if signed and field.startswith('-'):
+        field = field[1:]
+    if fraction:
+        field, dot, frac = field.partition('.')
+        if dot and not frac.isdecimal():
+            return False
+    return field.isdecimal()
 
 def parse_line(line: str) -> Measurement | Calibration | None:
     """
     Parse of a line of serial data.
     Expected format: "Measurement: {mag_x}, {mag_y}, {mag_z}, {acc_x}, {acc_y}, {acc_z}"
     or "Calibration: {center_x}, {center_y}, {center_z}, {scale_x}, {scale_y}, {scale_z}, {radius}"
+
+    Well-formed lines are handled by a prefix check and ``str.split``, with
+    each field checked against the same digit form the regex patterns use.
+    The regexes are only used as a fallback for anything else.
     """
+    if line.startswith(MEAS_PREFIX):
+        parts = line[len(MEAS_PREFIX):].split(', ')
+        if len(parts) == 6 and all(_is_field(p, fraction=True) for p in parts):
+            mx, my, mz, ax, ay, az = map(float, parts)
+            return Measurement(mag=(mx, my, mz), acc=(ax, ay, az))
+    elif line.startswith(CAL_PREFIX):
+        parts = line[len(CAL_PREFIX):].split(', ')
+        if (len(parts) == 7 and all(_is_field(p) for p in parts[:6])
+                and _is_field(parts[6], signed=False)):
+            cx, cy, cz, sx, sy, sz, r = map(int, parts)
+            return Calibration(is_constant=True, center=(cx, cy, cz), scale=(sx, sy, sz), radius=r)
+
     match = meas_pattern.search(line)
     if match:
         try:
-            mag = (float(match.group(1)), float(match.group(2)), float(match.group(3)))
-            acc = (float(match.group(4)), float(match.group(5)), float(match.group(6)))
-            return Measurement(mag=mag, acc=acc)
+            mx, my, mz, ax, ay, az = map(float, match.groups())
+            return Measurement(mag=(mx, my, mz), acc=(ax, ay, az))
         except ValueError:
             logger.error("Error parsing measurement line: %s", line)
     match = cal_pattern.search(line)
     if match:
         try:
-            center = (int(match.group(1)), int(match.group(2)), int(match.group(3)))
-            scale = (int(match.group(4)), int(match.group(5)), int(match.group(6)))
-            radius = int(match.group(7))
-            return Calibration(is_constant=True, center=center, scale=scale, radius=radius)
+            cx, cy, cz, sx, sy, sz, r = map(int, match.groups())
+            return Calibration(is_constant=True, center=(cx, cy, cz), scale=(sx, sy, sz), radius=r)
         except ValueError:
             logger.error("Error parsing calibration line: %s", line)
     return None
@@ -11,6 +11,9 @@ from .quaternion import Quaternion
 
 # Size of the rendered earth image visualization
 IMAGE_SIZE = 400
+# Orientations whose quaternion dot product exceeds 1 - ORIENTATION_EPS
+# are treated as unchanged and do not trigger a redraw
+ORIENTATION_EPS = 1e-6
 
 class SphereOrientation:
     """Class to visualize sphere orientation using a quaternion.
@@ -30,6 +33,16 @@ class SphereOrientation:
         self.view.camera = 'turntable'
         self.view.camera.distance = 4.0
 
+        # Offscreen render size used by `to_bytes` for the default image size
+        self._render_size = (IMAGE_SIZE, IMAGE_SIZE)
+        self._expected_pixels = IMAGE_SIZE * IMAGE_SIZE
+
+        # Last drawn orientation and, for offscreen canvases, the last
+        # rendered frame so unchanged orientations can skip the GPU entirely
+        self._render = render
+        self._last_q = None
+        self._frame_cache = None
+
         # Textured Earth sphere
         meshdata = create_sphere(radius=1.0, rows=24, cols=48)
         earth_image = imread("assets/earth_texture.jpg")
@@ -61,16 +74,31 @@ class SphereOrientation:
 
         # Transform (updated every frame)
         self.transform = scene.transforms.MatrixTransform()
+        # Matrix buffer assigned to the transform. MatrixTransform keeps a
+        # reference rather than a copy, so only `update` may write to it.
+        self._matrix = np.eye(4, dtype=np.float32)
         self.sphere.transform = self.transform
         self.axes.transform = self.transform
 
         if render:
             self.canvas.show()
 
-    def update(self, quat: Quaternion):
-        """Update sphere orientation from quaternion."""
-        self.transform.matrix = quat.to_matrix4()
+    def update(self, quat: Quaternion) -> bool:
+        """
+        Update sphere orientation from quaternion.
+
+        Returns False without redrawing if the orientation is unchanged
+        (within ``ORIENTATION_EPS``) since the last update.
+        """
+        if self._last_q is not None and abs(np.dot(quat.q, self._last_q)) > 1 - ORIENTATION_EPS:
+            return False
+        self._last_q = quat.q.copy()
+        self._frame_cache = None
+        # Re-assign after writing in place so the transform drops its cached
+        # inverse and schedules a redraw.
+        self.transform.matrix = quat.to_matrix4(out=self._matrix)
         self.canvas.update()
+        return True
 
     def to_bytes(self, n_pixels: int = 200) -> bytes:
         """
@@ -89,16 +117,25 @@ class SphereOrientation:
         bytes 
             Row-major RGB bytes (R,G,B per pixel).
         """
-        if n_pixels <= 0:
-            raise ValueError("n_pixels must be > 0")
-        dim = int(np.sqrt(n_pixels))
-        if dim * dim != n_pixels:
-            raise ValueError("n_pixels must be a perfect square (width*height)")
-        render_size = (dim, dim)
-
-        # Render to an offscreen framebuffer at the requested resolution
+        if n_pixels == self._expected_pixels:
+            render_size = self._render_size
+        else:
+            if n_pixels <= 0:
+                raise ValueError("n_pixels must be > 0")
+            dim = int(np.sqrt(n_pixels))
+            if dim * dim != n_pixels:
+                raise ValueError("n_pixels must be a perfect square (width*height)")
+            render_size = (dim, dim)
+
+        # Offscreen canvases only change through `update`, so reuse the last
+        # frame if the orientation has not changed since it was rendered.
+        if self._frame_cache is not None and self._frame_cache[0] == render_size:
+            return self._frame_cache[1]
+
+        # Render to an offscreen framebuffer at the requested resolution.
+        # tobytes copies non-contiguous (e.g. flipped) images in a single pass.
         img = self.canvas.render(size=render_size, alpha=False)
-        # Ensure contiguous C-order before conversion to bytes
-        if not img.flags['C_CONTIGUOUS']:
-            img = np.ascontiguousarray(img)
-        return img.tobytes(order='C')
+        pixels = img.tobytes(order='C')
+        if not self._render:
+            self._frame_cache = (render_size, pixels)
+        return pixels